@@ -1,59 +1,114 @@
+import functools
+import mmap
 import os
-import json
+import pickle
+import re
+import orjson
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 ENV_PREFIX = "CORE_ENGINE_"
 NESTED_SEPARATOR = "__"
 
+_TRUE_VALUES = frozenset({"true", "yes", "1"})
+_FALSE_VALUES = frozenset({"false", "no", "0"})
+# Numeric shapes are matched up front so int()/float() are only called on
+# strings that will actually convert; the common non-numeric case (URLs,
+# addresses, keys) never pays for a raised-and-caught ValueError.
+_INT_RE = re.compile(r"^-?\d+$")
+_FLOAT_RE = re.compile(r"^-?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?$")
+
+@functools.lru_cache(maxsize=512)
 def _cast_value(value: str) -> Any:
-    """Attempts to cast a string value to a more specific type."""
+    """Attempts to cast a string value to a more specific type.
+
+    Results are memoized since the same small set of strings ("true",
+    "30", ...) recurs across repeated config reloads.
+    """
     val_lower = value.lower()
-    if val_lower in ("true", "yes", "1"):
+    if val_lower in _TRUE_VALUES:
         return True
-    if val_lower in ("false", "no", "0"):
+    if val_lower in _FALSE_VALUES:
         return False
-    try:
+    if _INT_RE.match(value):
         return int(value)
-    except ValueError:
-        pass
-    try:
+    if _FLOAT_RE.match(value):
         return float(value)
-    except ValueError:
-        pass
     return value
 
+def _flatten(config: Dict[str, Any], separator: str) -> Dict[str, tuple]:
+    """
+    Builds a flat index over every non-dict leaf of the configuration.
+
+    Maps the flattened key (e.g. "database__host") to a tuple of
+    (containing dict, leaf key) so callers can update leaves in place
+    with a single lookup.
+    """
+    index: Dict[str, tuple] = {}
+
+    def _walk(node: Dict[str, Any], path: str) -> None:
+        for key, value in node.items():
+            flat_key = f"{path}{separator}{key}" if path else key
+            if isinstance(value, dict):
+                _walk(value, flat_key)
+            else:
+                index[flat_key] = (node, key)
+
+    _walk(config, "")
+    return index
+
 def _update_from_env(config: Dict[str, Any], prefix: str, separator: str) -> None:
     """
     Updates the configuration dictionary with values from environment variables.
     It only overrides keys that already exist in the base configuration.
+
+    The config tree is flattened into a key index once up front, so each
+    environment variable resolves with a single dict lookup instead of a
+    per-level traversal.
     """
+    flat_index = _flatten(config, separator)
     for env_key, value in os.environ.items():
         if not env_key.startswith(prefix):
             continue
 
         # Remove prefix and convert to lowercase
         # e.g., CORE_ENGINE_DATABASE__HOST -> database__host
-        config_path_str = env_key[len(prefix):].lower()
-        
-        # Split into path components
-        # e.g., database__host -> ['database', 'host']
-        keys = config_path_str.split(separator)
-
-        # Traverse the config dict to find the target for update
-        current_level = config
-        for key in keys[:-1]:
-            if not isinstance(current_level.get(key), dict):
-                # If path does not exist in config, skip this env var
-                current_level = None
-                break
-            current_level = current_level.get(key)
-        
-        if current_level is not None:
-            final_key = keys[-1]
-            # Only update if the key already exists at this level
-            if final_key in current_level:
-                current_level[final_key] = _cast_value(value)
+        slot = flat_index.get(env_key[len(prefix):].lower())
+        if slot is not None:
+            parent, leaf = slot
+            parent[leaf] = _cast_value(value)
+
+def _read_cache(cache_path: Path, sig: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached parsed config if it matches the source signature.
+
+    The cache file is memory-mapped so a warm load unpickles straight from
+    the page cache. Any problem (missing file, torn write, stale pickle)
+    simply falls back to parsing the JSON source.
+    """
+    try:
+        with cache_path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cached_sig, config = pickle.loads(mm)
+        if cached_sig == sig:
+            return config
+    except (OSError, ValueError, EOFError, pickle.PickleError):
+        pass
+    return None
+
+def _write_cache(cache_path: Path, sig: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """
+    Writes the parsed config cache atomically (tmp file + os.replace) so a
+    crash mid-write can never leave a torn cache. Best effort: failures
+    (e.g. a read-only filesystem) just mean the JSON is re-parsed next time.
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump((sig, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 def load_config(path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -75,6 +130,10 @@ def load_config(path: Union[str, Path]) -> Dict[str, Any]:
     - Values that can be parsed as integers or floats are cast accordingly.
     - All other values remain strings.
 
+    The parsed (pre-override) config is cached in a pickle file next to the
+    source, keyed on the file's mtime and size, so repeated loads of an
+    unchanged file skip the JSON parse.
+
     Args:
         path: The path to the JSON configuration file.
 
@@ -83,14 +142,24 @@ def load_config(path: Union[str, Path]) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If the config file does not exist.
-        json.JSONDecodeError: If the config file is not valid JSON.
+        orjson.JSONDecodeError: If the config file is not valid JSON.
     """
     config_path = Path(path)
     if not config_path.is_file():
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
 
-    with config_path.open('r', encoding='utf-8') as f:
-        config = json.load(f)
+    # Parse-once cache: the parsed dict is pickled next to the source,
+    # keyed on the file's mtime+size, so repeated loads (e.g. frequent
+    # restarts) skip the JSON parse entirely.
+    stat = config_path.stat()
+    sig = (stat.st_mtime_ns, stat.st_size)
+    cache_path = config_path.with_name(config_path.name + ".cache.pkl")
+    config = _read_cache(cache_path, sig)
+    if config is None:
+        # orjson parses bytes directly, so read in binary mode.
+        with config_path.open('rb') as f:
+            config = orjson.loads(f.read())
+        _write_cache(cache_path, sig, config)
 
     _update_from_env(config, prefix=ENV_PREFIX, separator=NESTED_SEPARATOR)
     
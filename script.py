@@ -1,14 +1,18 @@
-import json
+import asyncio
 import logging
+import sqlite3
 import sys
 import time
-from typing import Dict, Any, List, Set, Optional
-
-import requests
-from web3 import Web3
-from web3.contract import Contract
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+import httpx
+import orjson
+from eth_utils import event_abi_to_log_topic
+from web3 import AsyncWeb3, Web3
+from web3._utils.events import get_event_data
+from web3.contract import AsyncContract
 from web3.types import LogReceipt
-from requests.exceptions import RequestException
 
 # --- CONFIGURATION --- #
 # In a real application, this would be loaded from a secure configuration file or environment variables.
@@ -33,12 +37,13 @@ CONFIG = {
         "gas_station_url": "https://gasstation-mumbai.matic.today/v2"
     },
     "run_interval_seconds": 30, # How often to poll for new events
-    "block_processing_limit": 100 # Max blocks to process in one go to avoid RPC timeouts
+    "block_processing_limit": 100, # Max blocks to process in one go to avoid RPC timeouts
+    "state_db_path": "bridge_state.db" # Checkpoint database so restarts resume from the last block
 }
 
 # --- CONTRACT ABIs --- #
 # A simplified ABI for the source chain bridge contract.
-SOURCE_CONTRACT_ABI = json.dumps([
+SOURCE_CONTRACT_ABI = [
     {
         "anonymous": False, "type": "event", "name": "TokensLocked",
         "inputs": [
@@ -49,10 +54,10 @@ SOURCE_CONTRACT_ABI = json.dumps([
             {"name": "transactionNonce", "type": "bytes32", "indexed": True}
         ]
     }
-])
+]
 
 # A simplified ABI for the destination chain bridge contract.
-DEST_CONTRACT_ABI = json.dumps([
+DEST_CONTRACT_ABI = [
     {
         "type": "function", "name": "mint",
         "stateMutability": "nonpayable",
@@ -63,35 +68,77 @@ DEST_CONTRACT_ABI = json.dumps([
             {"name": "sourceTransactionNonce", "type": "bytes32"}
         ]
     }
-])
+]
+
+class RPCTimeout(Exception):
+    """Raised when an RPC log query fails, typically due to timeout on an
+    oversized block range."""
 
 class ChainConnector:
     """A robust wrapper for web3.py to handle blockchain interactions.
 
     This class manages the connection to an RPC endpoint, provides helper
-    methods for fetching blockchain data, and includes basic retry logic
-    for connection establishment.
+    coroutines for fetching blockchain data, and includes basic retry logic
+    for connection establishment. The RPC handshake is deferred until
+    `connect()` is first awaited, so an unreachable chain does not block
+    (or abort) startup before any work needs it.
     """
-    def __init__(self, name: str, rpc_url: str, contract_address: str, contract_abi: str):
+    def __init__(self, name: str, rpc_url: str, contract_address: str, contract_abi: list):
         self.name = name
         self.rpc_url = rpc_url
-        self.web3: Optional[Web3] = None
+        self._web3: Optional[AsyncWeb3] = None
         self.contract_address = Web3.to_checksum_address(contract_address)
         self.contract_abi = contract_abi
-        self.contract: Optional[Contract] = None
-        self._connect()
-
-    def _connect(self, max_retries: int = 3, delay: int = 5) -> None:
+        self._contract: Optional[AsyncContract] = None
+        # Precompute event ABIs and per-event log-filter params once so
+        # polling can use raw eth_getLogs calls instead of per-call filter
+        # creation, and each poll reuses the same filter dict.
+        self._event_abis: Dict[str, Dict[str, Any]] = {
+            entry["name"]: entry for entry in contract_abi if entry.get("type") == "event"
+        }
+        self._log_filters: Dict[str, Dict[str, Any]] = {
+            name: {"address": self.contract_address, "topics": [event_abi_to_log_topic(abi)]}
+            for name, abi in self._event_abis.items()
+        }
+        self._codec = None  # ABI codec, cached at connect time
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """The connected AsyncWeb3 instance; `connect()` must have run."""
+        if self._web3 is None:
+            raise ConnectionError(f"Not connected to {self.name}; await connect() first.")
+        return self._web3
+
+    @property
+    def contract(self) -> AsyncContract:
+        """The bound contract object; `connect()` must have run."""
+        if self._contract is None:
+            raise ConnectionError(f"Not connected to {self.name}; await connect() first.")
+        return self._contract
+
+    async def connect(self) -> None:
+        """Establishes the connection on first use; a no-op afterwards."""
+        async with self._connect_lock:
+            if self._web3 is None:
+                await self._connect()
+
+    async def _connect(self, max_retries: int = 3, delay: int = 5) -> None:
         """Establishes a connection to the RPC endpoint with retries."""
         for attempt in range(max_retries):
             try:
-                self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-                if self.web3.is_connected():
+                web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(
+                    self.rpc_url,
+                    request_kwargs={"timeout": 10}
+                ))
+                if await web3.is_connected():
                     logging.info(f"Successfully connected to {self.name} at {self.rpc_url}")
-                    self.contract = self.web3.eth.contract(
+                    self._contract = web3.eth.contract(
                         address=self.contract_address,
                         abi=self.contract_abi
                     )
+                    self._codec = web3.codec
+                    self._web3 = web3
                     return
                 else:
                     raise ConnectionError("Web3 provider not connected.")
@@ -100,30 +147,36 @@ class ChainConnector:
                     f"Connection to {self.name} failed (attempt {attempt + 1}/{max_retries}): {e}"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
         logging.error(f"Could not connect to {self.name} after {max_retries} attempts.")
         raise ConnectionError(f"Failed to connect to {self.name}.")
 
-    def get_latest_block(self) -> int:
+    async def get_latest_block(self) -> int:
         """Fetches the latest block number from the connected chain."""
-        if not self.web3:
-            raise ConnectionError(f"Not connected to {self.name}.")
-        return self.web3.eth.block_number
+        return await self.web3.eth.block_number
 
-    def get_events(self, from_block: int, to_block: int, event_name: str) -> List[LogReceipt]:
-        """Scans a range of blocks for a specific event."""
-        if not self.contract or not hasattr(self.contract.events, event_name):
+    async def get_events(self, from_block: int, to_block: int, event_name: str) -> List[LogReceipt]:
+        """Scans a range of blocks for a specific event.
+
+        Uses a single `eth_getLogs` call with the precomputed event topic
+        rather than creating a server-side filter, which would cost an
+        extra RPC round-trip per poll.
+        """
+        if event_name not in self._event_abis:
             logging.error(f"Event '{event_name}' not found in contract ABI for {self.name}.")
             return []
         try:
-            event_filter = self.contract.events[event_name].create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            return event_filter.get_all_entries()
+            raw_logs = await self.web3.eth.get_logs({
+                **self._log_filters[event_name],
+                "fromBlock": from_block,
+                "toBlock": to_block,
+            })
+            event_abi = self._event_abis[event_name]
+            codec = self._codec
+            return [get_event_data(codec, event_abi, log) for log in raw_logs]
         except Exception as e:
             logging.error(f"Error fetching events from {self.name}: {e}")
-            return []
+            raise RPCTimeout(f"eth_getLogs failed on {self.name}") from e
 
 class RelayerEventHandler:
     """Handles the logic of processing an event and preparing the destination transaction.
@@ -132,87 +185,149 @@ class RelayerEventHandler:
     source chain, validates it, and constructs the corresponding transaction to be
     executed on the destination chain.
     """
+    # How long a fetched gas price stays fresh. Gas recommendations move on
+    # the order of blocks, so all events in one poll can share a fetch.
+    GAS_CACHE_TTL_SECONDS = 5.0
+
     def __init__(self, dest_connector: ChainConnector, config: Dict[str, Any]):
         self.dest_connector = dest_connector
         self.relayer_wallet = Web3.to_checksum_address(config["destination_chain"]["relayer_wallet"])
         self.gas_station_url = config["api"]["gas_station_url"]
+        # (fetch timestamp, last successful response) for the gas station.
+        # The lock makes refreshes single-flight: when a gathered batch
+        # misses the cache together, one coroutine fetches and the rest
+        # reuse its result.
+        self._gas_cache: tuple = (0.0, None)
+        self._gas_lock = asyncio.Lock()
+        # Keep-alive HTTP/2 client for the gas station so TLS handshakes
+        # are amortized across events and requests share one connection;
+        # transient connection failures are retried by the transport.
+        self._http = httpx.AsyncClient(
+            http2=True,
+            transport=httpx.AsyncHTTPTransport(retries=2),
+            timeout=httpx.Timeout(5.0, connect=3.05)
+        )
+        # The chain id never changes mid-run; fetched once on first event so
+        # a lazy destination connector stays untouched until then. The lock
+        # keeps the first gathered batch from all issuing the RPC at once.
+        self._chain_id: Optional[int] = None
+        self._chain_id_lock = asyncio.Lock()
+        # Local nonce counter (standard relayer pattern): seeded from RPC on
+        # first use, incremented after each prepared transaction, and
+        # re-fetched only after a failure leaves it in doubt. The lock keeps
+        # nonce assignment sequential when events are processed concurrently.
+        self._next_nonce: Optional[int] = None
+        self._nonce_lock = asyncio.Lock()
         # In a real relayer, a secure key management system (like HashiCorp Vault)
         # would be used instead of a hardcoded private key.
         self.private_key_placeholder = config["destination_chain"]["relayer_private_key"]
 
-    def _get_recommended_gas_price(self) -> Optional[Dict[str, Any]]:
-        """Fetches recommended gas prices from a gas station API."""
-        try:
-            response = requests.get(self.gas_station_url, timeout=10)
-            response.raise_for_status()
-            gas_data = response.json()
-            # We are interested in the fast tier to ensure timely processing
-            return gas_data.get('fast')
-        except RequestException as e:
-            logging.error(f"Failed to fetch gas prices: {e}")
-            return None
-
-    def process_lock_event(self, event: LogReceipt) -> bool:
+    async def _get_recommended_gas_price(self) -> Optional[Dict[str, Any]]:
+        """Fetches recommended gas prices from a gas station API.
+
+        Responses are cached for a short TTL so a burst of events shares a
+        single fetch. If the API is unreachable, the last known value is
+        served stale rather than failing the event outright.
+        """
+        fetched_at, cached = self._gas_cache
+        if cached is not None and time.monotonic() - fetched_at < self.GAS_CACHE_TTL_SECONDS:
+            return cached
+        async with self._gas_lock:
+            # Another coroutine may have refreshed while we waited.
+            fetched_at, cached = self._gas_cache
+            if cached is not None and time.monotonic() - fetched_at < self.GAS_CACHE_TTL_SECONDS:
+                return cached
+            try:
+                response = await self._http.get(self.gas_station_url)
+                response.raise_for_status()
+                gas_data = response.json()
+                # We are interested in the fast tier to ensure timely processing
+                fast = gas_data.get('fast')
+                self._gas_cache = (time.monotonic(), fast)
+                return fast
+            except httpx.HTTPError as e:
+                logging.error(f"Failed to fetch gas prices: {e}")
+                # Stale-while-revalidate: keep relaying on the last good value
+                # during gas-API outages.
+                return cached
+
+    async def process_lock_event(self, event: LogReceipt) -> bool:
         """Processes a TokensLocked event and simulates relaying a mint transaction."""
         try:
             args = event['args']
-            nonce = event['args']['transactionNonce'].hex()
             logging.info(
-                f"Processing TokensLocked event (nonce: {nonce}):\n" 
-                f"  User: {args['user']}\n" 
-                f"  Token: {args['token']}\n" 
-                f"  Amount: {args['amount']}"
+                "Processing TokensLocked event (nonce: %s):\n"
+                "  User: %s\n"
+                "  Token: %s\n"
+                "  Amount: %s",
+                args['transactionNonce'].hex(), args['user'], args['token'], args['amount']
             )
 
-            if not self.dest_connector.web3 or not self.dest_connector.contract:
-                logging.error("Destination chain not connected, cannot prepare transaction.")
-                return False
-
             # --- Build Transaction for Destination Chain ---
+            # The first event triggers the deferred destination handshake;
+            # a ConnectionError lands in the except below.
+            await self.dest_connector.connect()
             dest_web3 = self.dest_connector.web3
             dest_contract = self.dest_connector.contract
+            if self._chain_id is None:
+                async with self._chain_id_lock:
+                    if self._chain_id is None:
+                        self._chain_id = await dest_web3.eth.chain_id
 
             # 1. Fetch recommended gas prices
-            gas_price_info = self._get_recommended_gas_price()
+            gas_price_info = await self._get_recommended_gas_price()
             if not gas_price_info or 'maxPriorityFeePerGas' not in gas_price_info:
                 logging.warning("Could not fetch gas price, proceeding with provider's estimate.")
                 # Fallback to web3's estimate if API fails
                 gas_params = {"gas": 200000} # Set a reasonable gas limit
             else:
+                # Inline gwei -> wei conversion; to_wei routes through
+                # Decimal and unit-table lookups we don't need per event.
                 gas_params = {
                     'gas': 200000,
-                    'maxFeePerGas': dest_web3.to_wei(gas_price_info['maxFee'], 'gwei'),
-                    'maxPriorityFeePerGas': dest_web3.to_wei(gas_price_info['maxPriorityFee'], 'gwei')
+                    'maxFeePerGas': int(float(gas_price_info['maxFee']) * 1e9),
+                    'maxPriorityFeePerGas': int(float(gas_price_info['maxPriorityFee']) * 1e9)
                 }
 
-            # 2. Build the 'mint' function call
-            txn = dest_contract.functions.mint(
+            # 2. Claim the next transaction nonce, then build the 'mint' call
+            async with self._nonce_lock:
+                if self._next_nonce is None:
+                    self._next_nonce = await dest_web3.eth.get_transaction_count(self.relayer_wallet)
+                tx_nonce = self._next_nonce
+                self._next_nonce += 1
+            txn = await dest_contract.functions.mint(
                 args['user'],
                 args['token'],
                 args['amount'],
                 args['transactionNonce']
             ).build_transaction({
                 'from': self.relayer_wallet,
-                'nonce': dest_web3.eth.get_transaction_count(self.relayer_wallet),
-                'chainId': dest_web3.eth.chain_id,
+                'nonce': tx_nonce,
+                'chainId': self._chain_id,
                 **gas_params
             })
 
-            logging.info(f"Prepared mint transaction for destination chain ({self.dest_connector.name}).")
-            logging.debug(f"Transaction details: {txn}")
+            logging.info("Prepared mint transaction for destination chain (%s).", self.dest_connector.name)
+            logging.debug("Transaction details: %s", txn)
 
             # --- Simulation Step ---
             # In a real system, the next steps would be to sign and send the transaction:
             # signed_txn = dest_web3.eth.account.sign_transaction(txn, self.private_key_placeholder)
             # tx_hash = dest_web3.eth.send_raw_transaction(signed_txn.rawTransaction)
             # logging.info(f"Transaction sent to {self.dest_connector.name}, hash: {tx_hash.hex()}")
-            print("--- SIMULATION: TRANSACTION WOULD BE SENT ---")
-            print(json.dumps(txn, indent=2, default=str))
-            print("-------------------------------------------")
+            # Serializing the full transaction costs ~1kB per event, so only
+            # dump it when debugging is on.
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                print("--- SIMULATION: TRANSACTION WOULD BE SENT ---")
+                print(orjson.dumps(txn, option=orjson.OPT_INDENT_2, default=str).decode())
+                print("-------------------------------------------")
 
             return True
         except Exception as e:
             logging.exception(f"An unexpected error occurred during event processing: {e}")
+            # The local counter may be out of sync with the chain after a
+            # failure; re-seed it from RPC on the next event.
+            self._next_nonce = None
             return False
 
 class CrossChainBridgeListener:
@@ -221,32 +336,72 @@ class CrossChainBridgeListener:
     It manages the overall lifecycle: configuration, state, connections,
     and the main event polling loop.
     """
+    # Upper bound on remembered nonces. Old entries are evicted in insertion
+    # order; the recency window this leaves is far deeper than chain
+    # finality, so deduplication is unaffected.
+    MAX_TRACKED_NONCES = 100_000
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        # Hoist hot-path settings out of the nested config dict; the poll
+        # loop reads these every iteration.
+        self._event_name: str = config["source_chain"]["event_name"]
+        self._run_interval: int = config["run_interval_seconds"]
         self._setup_logging()
 
         # State management
-        # In a production system, this state would be persisted in a database (e.g., Redis, PostgreSQL)
-        self.last_processed_block: int = config["source_chain"]["start_block"]
-        self.processed_tx_nonces: Set[str] = set()
-
-        try:
-            self.source_connector = ChainConnector(
-                name=config["source_chain"]["name"],
-                rpc_url=config["source_chain"]["rpc_url"],
-                contract_address=config["source_chain"]["contract_address"],
-                contract_abi=SOURCE_CONTRACT_ABI
-            )
-            self.dest_connector = ChainConnector(
-                name=config["destination_chain"]["name"],
-                rpc_url=config["destination_chain"]["rpc_url"],
-                contract_address=config["destination_chain"]["contract_address"],
-                contract_abi=DEST_CONTRACT_ABI
+        # Checkpoints live in a local sqlite database so a restart resumes
+        # from the last processed block instead of re-scanning from the
+        # configured start block.
+        self._state_db = sqlite3.connect(
+            config.get("state_db_path", "bridge_state.db"),
+            isolation_level=None  # autocommit; WAL keeps writes cheap
+        )
+        self._state_db.execute("PRAGMA journal_mode=WAL")
+        self._state_db.execute("CREATE TABLE IF NOT EXISTS state (k TEXT PRIMARY KEY, v INTEGER)")
+        self._state_db.execute("CREATE TABLE IF NOT EXISTS nonces (n BLOB PRIMARY KEY)")
+
+        row = self._state_db.execute("SELECT v FROM state WHERE k = 'last_block'").fetchone()
+        self.last_processed_block: int = row[0] if row else config["source_chain"]["start_block"]
+        # Nonces are kept as the raw 32-byte values; hex-encoding is only
+        # done when formatting log messages. An OrderedDict used as an LRU
+        # bounds memory for long-running processes.
+        self.processed_tx_nonces: "OrderedDict[bytes, None]" = OrderedDict()
+        # Load only the newest entries, oldest first so LRU eviction order
+        # matches insertion order.
+        recent_nonces = self._state_db.execute(
+            "SELECT n FROM nonces ORDER BY rowid DESC LIMIT ?",
+            (self.MAX_TRACKED_NONCES,)
+        ).fetchall()
+        for (nonce,) in reversed(recent_nonces):
+            self.processed_tx_nonces[bytes(nonce)] = None
+        if row:
+            logging.info(
+                "Resuming from checkpoint: block %d, %d known nonce(s).",
+                self.last_processed_block, len(self.processed_tx_nonces)
             )
-            self.event_handler = RelayerEventHandler(self.dest_connector, config)
-        except ConnectionError as e:
-            logging.critical(f"Initialization failed: could not connect to a blockchain. {e}")
-            sys.exit(1)
+
+        # Connectors dial lazily: the source chain is connected when run()
+        # starts, the destination only when an event needs relaying.
+        self.source_connector = ChainConnector(
+            name=config["source_chain"]["name"],
+            rpc_url=config["source_chain"]["rpc_url"],
+            contract_address=config["source_chain"]["contract_address"],
+            contract_abi=SOURCE_CONTRACT_ABI
+        )
+        self.dest_connector = ChainConnector(
+            name=config["destination_chain"]["name"],
+            rpc_url=config["destination_chain"]["rpc_url"],
+            contract_address=config["destination_chain"]["contract_address"],
+            contract_abi=DEST_CONTRACT_ABI
+        )
+        self.event_handler = RelayerEventHandler(self.dest_connector, config)
+
+        # Adaptive block window: doubled after a clean poll that found
+        # events (fast catch-up), halved when the RPC chokes on a range.
+        self._window: int = config["block_processing_limit"]
+        self._window_min = 10
+        self._window_max = 10_000
 
     def _setup_logging(self):
         """Configures a standardized logger for the application."""
@@ -257,63 +412,136 @@ class CrossChainBridgeListener:
         )
         logging.info("Logger initialized.")
 
-    def _poll_for_events(self):
+    def _persist_state(self, new_nonces: List[bytes]) -> None:
+        """Checkpoints the block cursor and freshly processed nonces."""
+        self._state_db.execute(
+            "INSERT OR REPLACE INTO state (k, v) VALUES ('last_block', ?)",
+            (self.last_processed_block,)
+        )
+        if new_nonces:
+            self._state_db.executemany(
+                "INSERT OR IGNORE INTO nonces (n) VALUES (?)",
+                [(bytes(nonce),) for nonce in new_nonces]
+            )
+            # Prune rows past the in-memory cap so the table (and the next
+            # startup's working set) stays bounded like the LRU itself.
+            self._state_db.execute(
+                "DELETE FROM nonces WHERE rowid NOT IN "
+                "(SELECT rowid FROM nonces ORDER BY rowid DESC LIMIT ?)",
+                (self.MAX_TRACKED_NONCES,)
+            )
+
+    async def _poll_for_events(self):
         """The core logic for scanning for and processing new events."""
         try:
-            latest_block = self.source_connector.get_latest_block()
+            latest_block = await self.source_connector.get_latest_block()
             # Define the block range to scan in this iteration
             from_block = self.last_processed_block + 1
-            to_block = min(latest_block, from_block + self.config["block_processing_limit"])
+            to_block = min(latest_block, from_block + self._window - 1)
 
             if from_block > to_block:
                 logging.info(f"No new blocks to process. Current head is {latest_block}.")
                 return
 
-            logging.info(f"Scanning for '{self.config['source_chain']['event_name']}' events from block {from_block} to {to_block}...")
+            logging.info(f"Scanning for '{self._event_name}' events from block {from_block} to {to_block}...")
 
-            events = self.source_connector.get_events(
-                from_block=from_block,
-                to_block=to_block,
-                event_name=self.config['source_chain']['event_name']
-            )
+            try:
+                events = await self.source_connector.get_events(
+                    from_block=from_block,
+                    to_block=to_block,
+                    event_name=self._event_name
+                )
+            except RPCTimeout:
+                # Back off multiplicatively and retry the same range on the
+                # next poll with a smaller window.
+                self._window = max(self._window_min, self._window // 2)
+                logging.warning(
+                    "RPC failed on blocks %d-%d; shrinking scan window to %d blocks.",
+                    from_block, to_block, self._window
+                )
+                return
 
+            new_nonces: List[bytes] = []
+            retry_from: Optional[int] = None
             if not events:
                 logging.info("No new events found in this range.")
             else:
                 logging.info(f"Found {len(events)} new event(s). Processing...")
-                for event in sorted(events, key=lambda e: e['blockNumber']): # Process in order
-                    nonce = event['args']['transactionNonce'].hex()
-                    if nonce in self.processed_tx_nonces:
-                        logging.warning(f"Skipping already processed event with nonce {nonce}.")
+                # Fan the batch out concurrently; results are collected
+                # (and nonces committed) in block order below.
+                to_process = []
+                submitted = set()
+                # eth_getLogs already returns logs ordered by
+                # (blockNumber, logIndex); no need to re-sort.
+                for event in events:
+                    nonce = event['args']['transactionNonce']
+                    if nonce in self.processed_tx_nonces or nonce in submitted:
+                        logging.warning("Skipping already processed event with nonce %s.", nonce.hex())
                         continue
+                    submitted.add(nonce)
+                    to_process.append((nonce, event))
 
-                    if self.event_handler.process_lock_event(event):
-                        self.processed_tx_nonces.add(nonce)
+                results = await asyncio.gather(
+                    *(self.event_handler.process_lock_event(event) for _, event in to_process)
+                )
+                for (nonce, event), processed in zip(to_process, results):
+                    if processed:
+                        self.processed_tx_nonces[nonce] = None
+                        new_nonces.append(nonce)
+                        if len(self.processed_tx_nonces) > self.MAX_TRACKED_NONCES:
+                            self.processed_tx_nonces.popitem(last=False)
+                    elif retry_from is None:
+                        # Events arrive in block order, so the first failure
+                        # is the lowest failed block.
+                        retry_from = event['blockNumber']
+
+            # Update state for the next run and checkpoint it. Never advance
+            # the cursor past a failed event: its block is rescanned on the
+            # next poll (processed nonces dedupe the successes around it)
+            # instead of being checkpointed away and lost.
+            if retry_from is not None:
+                logging.warning(
+                    "Event processing failed at block %d; will rescan from there next poll.",
+                    retry_from
+                )
+                self.last_processed_block = max(self.last_processed_block, retry_from - 1)
+            else:
+                self.last_processed_block = to_block
+            self._persist_state(new_nonces)
 
-            # Update state for the next run
-            self.last_processed_block = to_block
+            # The range came back cleanly; widen the window to catch up
+            # faster when there is a backlog of blocks.
+            if events and retry_from is None:
+                self._window = min(self._window_max, self._window * 2)
 
         except Exception as e:
             logging.exception(f"An error occurred in the polling loop: {e}")
 
-    def run(self):
+    async def run(self):
         """Starts the main listener loop."""
-        logging.info(f"Starting cross-chain listener for bridge: {self.config['source_chain']['name']} -> {self.config['destination_chain']['name']}")
+        logging.info(f"Starting cross-chain listener for bridge: {self.source_connector.name} -> {self.dest_connector.name}")
+        try:
+            await self.source_connector.connect()
+        except ConnectionError as e:
+            logging.critical(f"Initialization failed: could not connect to the source chain. {e}")
+            sys.exit(1)
         while True:
             try:
-                self._poll_for_events()
-                logging.info(f"Loop finished. Waiting {self.config['run_interval_seconds']} seconds for next run.")
-                time.sleep(self.config['run_interval_seconds'])
-            except KeyboardInterrupt:
-                logging.info("Shutdown signal received. Exiting listener.")
-                break
+                await self._poll_for_events()
+                logging.info(f"Loop finished. Waiting {self._run_interval} seconds for next run.")
+                await asyncio.sleep(self._run_interval)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logging.critical(f"A critical unhandled error occurred in the main loop: {e}")
-                time.sleep(60) # Wait longer after a critical failure
+                await asyncio.sleep(60) # Wait longer after a critical failure
 
 if __name__ == '__main__':
     listener = CrossChainBridgeListener(CONFIG)
-    listener.run()
+    try:
+        asyncio.run(listener.run())
+    except KeyboardInterrupt:
+        logging.info("Shutdown signal received. Exiting listener.")
 
 # @-internal-utility-start
 def validate_payload_5910(payload: dict):